@@ -41,32 +41,32 @@ class Render(object):
         self._width = width
         # 2^n - 1: 2^7 - 1 -> 0x7F
         self._bits = (1 << width) - 1
+        # bytec -> shift of each byte, most significant first
+        self._shifts = {}
 
     def tomidi(self, val, bytec):
         ''' convert val to stream of MIDI bytes using specified _width
         '''
-        result, temp = (val, [])
-        while temp:
-            result.insert(0, temp & self._bits)
-            temp >>= self._width
+        try:
+            shifts = self._shifts[bytec]
+        except KeyError:
+            shifts = self._shifts[bytec] = tuple(
+                range(self._width * (bytec - 1), -1, -self._width))
 
-        cbyte = len(result)
-        if cbyte > bytec:
+        if val >> (self._width * bytec):
             raise ValueError(
                 'value %d too big for %d bytes' % (val, bytec))
 
-        while range(cbyte, bytec):
-            result.insert(0, 0)
-
-        return result
+        bits = self._bits
+        return [(val >> shift) & bits for shift in shifts]
 
     def tovalue(self, midi):
         ''' convert from MIDI based of number of important bits
         '''
+        width = self._width
         result = 0
         for abyte in midi:
-            result <<= self._width
-            result += abyte
+            result = (result << width) + abyte
 
         return result
 
@@ -113,6 +113,20 @@ class AKAISCIIRender(Render):
         raise ValueError('character not in Akai charset: %s' % chr(midi))
 
 
+# high bits of up to 7 bytes packed little endian into an int
+_HBB_HIGH = 0x80808080808080
+
+# low 7 bits of the same
+_HBB_LOW = 0x7F7F7F7F7F7F7F
+
+# gathers bit 7 of byte i to bit 56+i, see hbbxl_midi()
+_HBB_GATHER = sum(1 << (56 - 7*i) for i in range(7))
+
+# places bit i of a high bits byte at bit 7 of byte i
+_HBB_SPREAD = tuple([
+    sum(((hibits >> i) & 0x01) << (8*i + 7) for i in range(7))
+    for hibits in range(0x80)])
+
 def hbbxl_midi(block):
     ''' convert up to seven bytes of 8 bit data
           to up to 8 bytes of 7 bit data
@@ -122,20 +136,14 @@ def hbbxl_midi(block):
         - return: new array of bytes
         '''
     bytec = len(block)
-    if 1 > len(block) > 7:
+    if not 1 <= bytec <= 7:
         raise IndexError('block len %d: out of range' % bytec)
 
-    msb = 0
-    ret = []
-
-    # start from the end so that the high bit of
-    #  data[0] is the rightmost bit
-    while bytec > 0:
-        bytec -= 1
-        bit = (block[bytec] & 0x80) >> 7
-        msb <<= 1
-        msb |= bit
-        ret.insert(0, block[bytec] & 0x7F)
+    # the block is handled as one little endian word: byte i is
+    #  at bit 8*i, so the high bit of data[0] becomes bit 0 of msb
+    word = int.from_bytes(bytes(block), 'little')
+    msb = (((word & _HBB_HIGH) >> 7) * _HBB_GATHER >> 56) & 0x7F
+    ret = list((word & _HBB_LOW).to_bytes(bytec, 'little'))
 
     return msb, ret
 
@@ -144,15 +152,16 @@ def hbbxl_value(hibits, midi):
           data using bits from msb
         - hibits: ms bits of data, x6543210 order
         - midi:  array of bytes
+        - raise: IndexError if midi has more than 7 bytes
     '''
-    ret = []
     count = len(midi)
-    for i in range(0,count):
-        bit = (hibits & 0x01) << 7
-        ret.append(midi[i] | bit)
-        hibits >>= 1
+    if count > 7:
+        raise IndexError('midi len %d: out of range' % count)
+
+    word = int.from_bytes(bytes(midi), 'little')
+    word |= _HBB_SPREAD[hibits & ((1 << count) - 1)]
 
-    return ret
+    return list(word.to_bytes(count, 'little'))
 
 @renderer
 class HBB1HRender(Render):
@@ -197,9 +206,9 @@ class HBB8LRender(Render):
               data using bits from msb
               - midi:  array of bytes
         '''
-        if 2 > len(midi) > 8:
+        if not 2 <= len(midi) <= 8:
             raise IndexError(
-                'midi packet len %d: must be 2 < len < 8' % len(midi))
+                'midi packet len %d: must be 2 <= len <= 8' % len(midi))
 
         return hbbxl_value(midi[0], midi[1:])
 
@@ -231,6 +240,20 @@ class UINT8Render(Render):
     def __init__(self):
         super(UINT8Render, self).__init__(8)
 
+    def tomidi(self, val, bytec):
+        ''' whole bytes, int does the work
+        '''
+        try:
+            return list(val.to_bytes(bytec, 'big'))
+        except OverflowError as exc:
+            raise ValueError(
+                'value %d too big for %d bytes' % (val, bytec)) from exc
+
+    def tovalue(self, midi):
+        ''' whole bytes, int does the work
+        '''
+        return int.from_bytes(bytes(midi), 'big')
+
 
 _RINSTANCES = {}
 
@@ -239,13 +262,13 @@ def _xform(fun, name, *args):
           has been located
     '''
     try:
-        return getattr(_RINSTANCES[name], fun)(args)
+        return getattr(_RINSTANCES[name], fun)(*args)
     except KeyError:
         pass
 
     try:
         _RINSTANCES[name] = _RCLASSES[name]()
-        return _xform(fun, name, args)
+        return _xform(fun, name, *args)
 
     except KeyError as exc:
         raise ValueError(
@@ -36,6 +36,11 @@
       dumb cell
       holds a scalar value or a value provided by subclass constructor
 
+    LazyCell(AtomCell):
+      unparsed '(...)' substitution text
+      parsed by ListCell.factory() when first used, then forwards
+        everything to the parsed cell
+
     CListCell(AtomCell):
       compact representation for composite values - lists:
         a;b;..;z and members of subclasses.
@@ -84,7 +89,8 @@
       top-level parse for each cell
       detects CListCell (;) and RangeCell (..) syntax, dispatches
         constructor which will call factory() recursively as needed
-      detects top-level ListCell and calls ListCell.factory()
+      detects top-level ListCell and defers ListCell.factory() to
+        a LazyCell
       any other value is a literal (int, str, None, True, False) and
         is returned via the AtomCell constructor
     ListCell.factory():
@@ -95,6 +101,9 @@
 '''
 
 import re
+import sys
+import operator
+import itertools
 import functools
 from psysex import sysex
 
@@ -120,6 +129,23 @@ def listclass(sign):
 #   there is only one public interface to all of these:
 #     __call__() computes and returns a value
 
+# plain decimal integers, by far the most common literal
+_INT_RE = re.compile(r'[-+]?\d+$')
+
+# plain decimal fractions and exponents
+_FLOAT_RE = re.compile(r'[-+]?(\d+\.\d*|\.\d+|\d+(?=[eE]))([eE][-+]?\d+)?$')
+
+# anything int() or float() accepts in base 10 starts like this
+_NUM_RE = re.compile(r'\s*[-+]?(\d|\.\d|inf|nan)', re.IGNORECASE)
+
+_LITERALS = {
+    'yes':   True,
+    'no':    False,
+    'true':  True,
+    'false': False,
+    'none':  None
+}
+
 def encast(val, number=False, base=10):
     ''' convert a string to an internal type
         - val: string to convert
@@ -131,27 +157,57 @@ def encast(val, number=False, base=10):
     if not isinstance(val, str):
         return val
 
-    try:
-        return int(val, base)
-    except ValueError:
-        pass
-
-    try:
-        return float(val)
-    except ValueError:
-        if number:
-            raise ValueError(val)
-
-    try:
-        return {
-            'yes':   True,
-            'no':    False,
-            'true':  True,
-            'false': False,
-            'none':  None
-        }[val.lower()]
-    except KeyError:
-        return val
+    return _encast(val, number, base)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encast(val, number, base):
+    ''' encast() for strings
+          tables repeat the same literals over and over,
+          conversions are cached
+    '''
+    if base == 10:
+        if _INT_RE.match(val):
+            return int(val)
+        if _FLOAT_RE.match(val):
+            return float(val)
+        numeric = _NUM_RE.match(val)
+    else:
+        numeric = True
+
+    if numeric:
+        try:
+            return int(val, base)
+        except ValueError:
+            pass
+
+        try:
+            return float(val)
+        except ValueError:
+            pass
+
+    if number:
+        raise ValueError(val)
+
+    return _LITERALS.get(val.lower(), val)
+
+
+# sentinel for cached values: the value must be computed on each call
+_DYNAMIC = object()
+
+# canonical instances of parsed ints too big for CPython's small int cache
+_INT_POOL = {}
+
+def _intern(val):
+    ''' share one object between identical parsed constants
+        - val: value returned by encast()
+        - return: canonical instance of val
+    '''
+    if isinstance(val, str):
+        return sys.intern(val)
+    if isinstance(val, int) and not isinstance(val, bool):
+        return _INT_POOL.setdefault(val, val)
+    return val
 
 
 def factory(loc, row, content):
@@ -162,51 +218,63 @@ def factory(loc, row, content):
         - raise: ValueError on transitive '..'
         - return: an instance of a AtomCell subclass
     '''
-    # pylint: disable=too-many-return-statements
-
     if isinstance(content, list):
         return ListCell(loc, row, content)
 
     if not isinstance(content, str):
         return AtomCell(loc, row, content)
 
-    buf = content.lstrip().rstrip()
+    cls, val = _classify(content.strip())
+
+    if cls is RangeCell and len(val) > 2:
+        raise ValueError(
+            '%s: range cell syntax error: %s' % (
+                loc, '..'.join(val)))
+
+    return cls(loc, row, val)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify(buf):
+    ''' work out which cell the text of a cell describes
+          cells hold their row and location, so they can't be
+          shared, but the same text always parses the same way
+        - buf: stripped cell contents
+        - return: (class, constructor argument)
+    '''
+    # pylint: disable=too-many-return-statements
 
     if buf.startswith('@'):
         # forced literal, save
-        return AtomCell(loc, row, buf[1:])
+        return AtomCell, buf[1:]
 
     if not buf or buf.startswith('#'):
         # comment, no value
-        return AtomCell(loc, row, None)
+        return AtomCell, None
 
-    parts = buf.split(';')
-    if len(parts) > 1:
+    if ';' in buf:
         # each part is its own cell
-        return CListCell(loc, row, parts)
+        return CListCell, tuple(buf.split(';'))
 
-    parts = buf.split('..')
-    if len(parts) == 2:
-        # range expression
-        return RangeCell(loc, row, parts)
-    elif len(parts) > 2:
-        raise ValueError(
-            '%s: range cell syntax error: %s' % (
-                loc, buf))
+    if '..' in buf:
+        # range expression, factory() checks the syntax
+        return RangeCell, tuple(buf.split('..'))
 
     if buf.startswith('('):
         # cell is a substitution
-        #  parse to internal represenation
-        return ListCell.factory(loc, row, buf[1:])
+        #  parse to internal represenation when first used
+        return LazyCell, buf[1:]
 
     # literal
-    return AtomCell(loc, row, encast(buf))
+    return AtomCell, _intern(encast(buf))
 
 
 class AtomCell(object):
     ''' AtomCell: base class
           holds whatever it's told to hold
     '''
+    __slots__ = ('_loc', '_row', '_value')
+
     def __init__(self, loc, row, val):
         ''' default ctor for all subclasses
             - loc: [f, r, c, [s]] location of this cell
@@ -229,12 +297,64 @@ class AtomCell(object):
         # AtomCell is stupid.  Just give them the value
         return self._value
 
+    def constant(self):
+        ''' true if evaluating this cell always gives the same value
+        '''
+        # pylint: disable=no-self-use
+        return True
+
+
+class LazyCell(AtomCell):
+    ''' LazyCell: a substitution that has not been parsed yet
+          holds the text following '(' and hands everything to
+          the parsed cell once it is used
+    '''
+    __slots__ = ('_cell',)
+
+    def __init__(self, loc, row, val):
+        super().__init__(loc, row, val)
+        self._cell = None
+
+    def _parse(self):
+        ''' parse _value, once
+            - return: the parsed cell, an instance of a ListCell subclass
+        '''
+        if self._cell is None:
+            self._cell = ListCell.factory(self._loc, self._row, self._value)
+        return self._cell
+
+    def constant(self):
+        ''' unknown until parsed, assume not
+        '''
+        # pylint: disable=no-self-use
+        return False
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            # no parsing on behalf of copy, pickle and friends
+            raise AttributeError(name)
+        return getattr(self._parse(), name)
+
+    def __getitem__(self, item):
+        return self._parse()[item]
+
+    def __add__(self, other):
+        return self._parse() + other
+
+    def __call__(self, arg=None, syms=None):
+        return self._parse()(arg, syms)
+
+    def __str__(self):
+        return str(self._parse())
+
 
 class CListCell(AtomCell):
     ''' CListCell - Compact List AtomCell
           a cell which is a list of cells
           base class for RangeCells, ListCells ListCells
     '''
+    __slots__ = ()
+
     def __init__(self, loc, row, parts):
         ''' create a cell containing subcomponents
               when called from factory(), parts will be strings
@@ -261,7 +381,12 @@ class CListCell(AtomCell):
             - arg=None: provided by caller
             - return: constituent list, all items evaluated
         '''
-        return [val(arg, syms) for val in self[:]]
+        return [val(arg, syms) for val in self._value]
+
+    def constant(self):
+        ''' constant if all members are
+        '''
+        return all([val.constant() for val in self._value])
 
     def __str__(self):
         return ';'.join(['%s' % var() for var in self[:]])
@@ -270,6 +395,8 @@ class CListCell(AtomCell):
 class RangeCell(CListCell):
     ''' class for v..v cells
     '''
+    __slots__ = ()
+
     def __init__(self, loc, row, parts):
         ''' construct a RangeCell
               ListCell constructor handles the parsing of sub-components
@@ -294,14 +421,37 @@ class RangeCell(CListCell):
         return '..'.join(['%s' % val for val in self[:]])
 
 
+# one token: a (% ...) paste special (%, %%), a substitution
+#  character or a word running up to whitespace or ')'
+_TOKEN_RE = re.compile(r"\s*(%%?|[(><#~&|\-)!\]@$:]|[^)\s]+)")
+
+# substitution signs written twice: (<< ...), (>> ...)
+_DOUBLED = frozenset('<>')
+
+# substitutions that only take numbers
+_NUMERIC = frozenset('+&*~|<>-')
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(buf):
+    ''' split a substitution into (token, end) pairs
+          the same substitutions recur across rows and tables,
+          each distinct text is lexed once
+    '''
+    return tuple([(mat.group(1), mat.end()) for mat in _TOKEN_RE.finditer(buf)])
+
+
 class CellIterator(object):
     ''' iterator class for parsing cell tokens
     '''
     def __init__(self, buf):
-        ''' iterator ctor
+        ''' iterator ctor.  buf is split into tokens in one pass
             - buf: string to parse
         '''
         self._buf = buf
+        self._tokens = _tokenize(buf)
+        self._nth = 0
+        self._pos = 0
 
     def __iter__(self):
         return self
@@ -311,49 +461,24 @@ class CellIterator(object):
             - yield: next token if available
             - return: only when buf is exhausted
         '''
-        self._buf = self._buf.lstrip()
-
-        if not self._buf:
-            raise StopIteration
-
-        nextc = self.peek()
-
-        if nextc in '(><#~&|-)!]@$:':
-            self.advance(1)
-            # substitution character
-            return nextc
-
-        if nextc == '%':
-            # (% ...) subs use % args as ' ' and %% as '%'
-            #   special handling required
-            self.advance(1)
-            if self.peek() == '%':
-                self.advance(1)
-                nextc += '%'
-            return nextc
-
-        mat = re.match(r"[^)\s]+", self._buf)
-        if mat is None:
+        try:
+            token, self._pos = self._tokens[self._nth]
+        except IndexError:
             raise StopIteration
-
-        result = self._buf[mat.start():mat.end()]
-        self.advance(mat.end())
-        return result
+        self._nth += 1
+        return token
 
     def peek(self):
         ''' return the next character without advancing
         '''
-        return self._buf[0]
-
-    def advance(self, count=1):
-        ''' discard count characters
-        '''
-        self._buf = self._buf[count:]
+        return self._buf[self._pos]
 
 
 class ListCell(CListCell):
     ''' base class of all substitutions
     '''
+    __slots__ = ()
+
     sign = None
 
     @classmethod
@@ -367,43 +492,73 @@ class ListCell(CListCell):
         if isinstance(citer, str):
             citer = CellIterator(citer)
 
-        # pylint: disable=too-many-arguments
-
-        nextc = citer.peek()
-        try:
-            subclass = _LIST_CLASSES[nextc]
-            next(citer)
-            if nextc in '<>':
-                next(citer)
-        except KeyError:
-            # not listed, must be a List
-            subclass = cls
-
-        numreq = nextc in '+&*~|<>-'
-        radreq = 16 if nextc is '#' else 10
+        # one frame per open substitution, innermost last
+        #   nested substitutions push a frame instead of recursing
+        stack = [ListCell._frame(cls, loc, citer)]
 
-        args = []
         # parse substitution arguments
-        sloc = loc.copy()
-        for nth, token in enumerate(citer):
-            sloc['arg'] = nth
+        for token in citer:
+            _, subclass, sloc, args, number, base = stack[-1]
+            sloc['arg'] = len(args)
             if token == '(':
                 # arg is itself a substitution
-                args.append(
-                    ListCell.factory(sloc, row, citer))
+                stack.append(ListCell._frame(ListCell, sloc, citer))
 
             elif token == ')':
                 # end of substitution text
-                break
+                cell = ListCell._close(stack, row)
+                if not stack:
+                    return cell
 
             else:
                 # plain text token, make it a cell
                 args.append(
                     AtomCell(
                         sloc, row,
-                        encast(token, number=numreq, base=radreq)))
+                        _intern(encast(token, number=number, base=base))))
 
-        return subclass(loc, row, args)
+        # input ran out, close whatever is still open
+        while True:
+            cell = ListCell._close(stack, row)
+            if not stack:
+                return cell
+
+    @staticmethod
+    def _frame(default, loc, citer):
+        ''' start parsing a substitution
+            - default: class to use if the substitution has no sign
+            - loc: location of the substitution
+            - citer: CellIterator, positioned after '('
+            - return: (loc, subclass, arg loc, args, number, base)
+        '''
+        nextc = citer.peek()
+        subclass = _LIST_CLASSES.get(nextc)
+        if subclass is None:
+            # not listed, must be a List
+            subclass = default
+        else:
+            next(citer)
+            if nextc in _DOUBLED:
+                next(citer)
+
+        numreq = nextc in _NUMERIC
+        radreq = 16 if nextc == '#' else 10
+
+        loc = loc.copy()
+        return loc, subclass, loc.copy(), [], numreq, radreq
+
+    @staticmethod
+    def _close(stack, row):
+        ''' finish the innermost substitution
+            - stack: open substitutions, innermost is popped
+            - row: row holding the cell
+            - return: the new cell, also added to the enclosing args
+        '''
+        loc, subclass, _, args, _, _ = stack.pop()
+        cell = subclass(loc, row, args)
+        if stack:
+            stack[-1][3].append(cell)
+        return cell
 
     def __init__(self, loc, row, args):
         ''' ctor.  make a list of cells from citer
@@ -429,121 +584,180 @@ class ListCell(CListCell):
 
 class OpCell(ListCell):
     ''' Operator cells that can take an argument
+          each subclass provides its operation as job
+          operations on constants are done once, when constructed
     '''
-    def __init__(
-            self, loc, row, args, job):
-        ''' specialize by adding a seed and a job
+    __slots__ = ('_fixed',)
+
+    job = None
+
+    def __init__(self, loc, row, args):
+        ''' specialize by folding constant operands
         '''
-        # pylint: disable=unidiomatic-typecheck,too-many-arguments
+        # pylint: disable=unidiomatic-typecheck
         if type(self) is OpCell:
             # should only be called by subclasses
             raise sysex.CellError(
                 '%s: attempt to instantiate abstract OpCell', loc)
 
         super().__init__(loc, row, args)
-        self._job = job
+        self._fixed = _DYNAMIC
+
+        if self.constant():
+            try:
+                fixed = self._apply()
+            except (ArithmeticError, TypeError, ValueError):
+                # leave it to fail when evaluated
+                return
+            if isinstance(fixed, (int, float, str)):
+                self._fixed = fixed
 
     def __call__(self, arg=None, syms=None):
+        if self._fixed is not _DYNAMIC:
+            return self._fixed
+        return self._apply(arg, syms)
+
+    def _apply(self, arg=None, syms=None):
+        ''' do the operation
+        '''
         if len(self._value) == 1:
             # allow (op n) to be applied to a supplied arg
-            return self._job(self[0](arg, syms), arg)
-
-        vals = super().__call__(arg, syms)
-        # every subclass provides an operation-neutral starter value
-        return functools.reduce(self._job, vals[1:], vals[0])
+            return self.job(self[0](arg, syms), arg)
+
+        cells = self._value
+        if len(cells) == 2:
+            # the common (op a b) form needs no fold
+            return self.job(cells[0](arg, syms), cells[1](arg, syms))
+
+        # evaluate the operands as the fold consumes them
+        first = cells[0](arg, syms)
+        return functools.reduce(
+            self.job,
+            (cell(arg, syms) for cell in itertools.islice(cells, 1, None)),
+            first)
+
+    def constant(self):
+        ''' (op n) depends on the arg it is applied to
+        '''
+        return len(self._value) > 1 and super().constant()
 
     def __str__(self):
-        result = '(%s ' % self.__class__.sign
-        result += ' '.join(['%s' % val for val in self._value])
-        result += ')'
-        return result
+        return '(%s %s)' % (
+            self.__class__.sign, ' '.join(['%s' % val for val in self._value]))
 
 
 @listclass('+')
 class AddCell(OpCell):
     ''' implement (+ v v ...) substitution
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: x + y)
+    __slots__ = ()
+
+    job = staticmethod(operator.add)
 
 
 @listclass('&')
 class AndCell(OpCell):
     ''' implement (& v v ...)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: x & y)
+    __slots__ = ()
+
+    job = staticmethod(operator.and_)
 
 
 @listclass('*')
 class MulCell(OpCell):
     ''' implement (* v v ...)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: x * y)
+    __slots__ = ()
+
+    job = staticmethod(operator.mul)
 
 
 @listclass('~')
 class NotCell(OpCell):
     ''' implement (~ v)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: ~y)
+    __slots__ = ()
 
-    def __call__(self, arg=None, syms=None):
-        if self[:]:
-            return ~self[0]()
+    def _apply(self, arg=None, syms=None):
+        if self._value:
+            return ~self._value[0]()
         else:
             return ~arg
 
+    def constant(self):
+        ''' (~ v) ignores the arg
+        '''
+        return bool(self._value) and ListCell.constant(self)
+
 @listclass('|')
 class OrCell(OpCell):
     ''' implement (| v v ...) substitution
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: x | y)
+    __slots__ = ()
+
+    job = staticmethod(operator.or_)
 
 
 @listclass('%')
 class PasteCell(OpCell):
     ''' class for (% s s ...) substitutions
     '''
-    def __init__(self, loc, row, args):
-        ''' ctor
+    __slots__ = ()
+
+    # paste specials: % is a space, %% is a literal %
+    _PMAP = {'%': ' ', '%%': '%'}
+
+    @staticmethod
+    def job(left, right):
+        ''' do the string pasting, escaping %% and % specials
         '''
-        def paste(left, right):
-            ''' do the string pasting, escaping %% and % specials
-            '''
-            pmap = {'%': ' ', '%%': '%'}
-            right = '%s' % right
-            right = pmap[right] if right.startswith('%') else right
-            return '%s%s' % (left, right)
+        right = str(right)
+        return str(left) + PasteCell._PMAP.get(right, right)
 
-        super().__init__(loc, row, args, job=paste)
+    def _apply(self, arg=None, syms=None):
+        if len(self._value) == 1:
+            return super()._apply(arg, syms)
+
+        # join once rather than folding pairwise
+        pmap = PasteCell._PMAP
+        vals = [str(val) for val in ListCell.__call__(self, arg, syms)]
+        return vals[0] + ''.join([pmap.get(val, val) for val in vals[1:]])
 
 
 @listclass('<')
 class ShiftLCell(OpCell):
     ''' implement (<< ...)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: y << x)
+    __slots__ = ()
+
+    @staticmethod
+    def job(count, val):
+        ''' shift val left by count
+        '''
+        return val << count
 
 
 @listclass('>')
 class ShiftRCell(OpCell):
     ''' implement (>> ...)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: y >> x)
+    __slots__ = ()
+
+    @staticmethod
+    def job(count, val):
+        ''' shift val right by count
+        '''
+        return val >> count
 
 
 @listclass('-')
 class SubCell(OpCell):
     ''' implement (- v v ...)
     '''
-    def __init__(self, loc, row, args):
-        super().__init__(loc, row, args, job=lambda x, y: x - y)
+    __slots__ = ()
+
+    job = staticmethod(operator.sub)
 
 
 ## Reference Cells
@@ -551,20 +765,28 @@ class SubCell(OpCell):
 class RefCell(ListCell):
     ''' base class of all ref cells
     '''
+    __slots__ = ()
+
     def __init__(self, loc, row, args):
         super().__init__(loc, row, args)
 
+    def constant(self):
+        ''' references are resolved when evaluated
+        '''
+        # pylint: disable=no-self-use
+        return False
+
     def __str__(self):
-        result = '(%s ' % self.__class__.sign
-        result += ' '.join(['%s' % val for val in self[:]])
-        result += ')'
-        return result
+        return '(%s %s)' % (
+            self.__class__.sign, ' '.join(['%s' % val for val in self._value]))
 
 
 @listclass('!')
 class ModCell(RefCell):
     ''' (! module)
     '''
+    __slots__ = ()
+
     def __init__(self, loc, row, args):
         super().__init__(loc, row, args)
 
@@ -579,6 +801,8 @@ class ModCell(RefCell):
 class TabCell(RefCell):
     ''' (] [mod] table)
     '''
+    __slots__ = ()
+
     @classmethod
     def tab(cls, row, names):
         ''' look up a table by name, resolving module if needed
@@ -603,6 +827,8 @@ class TabCell(RefCell):
 class RowCell(RefCell):
     ''' (@ [[mod] tab] row)
     '''
+    __slots__ = ()
+
     @classmethod
     def row(cls, row, names):
         ''' look up a row by name, resolving table if needed
@@ -640,13 +866,15 @@ class RowCell(RefCell):
 class ColCell(RefCell):
     ''' ($ [[[mod] tab] row] col])
     '''
+    __slots__ = ()
+
     def __init__(self, loc, row, args):
         super().__init__(loc, row, args)
 
     def __call__(self, arg=None, syms=None):
         ''' look up a cell
         '''
-        if len(self[:]) > 1:
+        if len(self._value) > 1:
             row = RowCell.row(self._row, self[:-1])
         else:
             row = self._row
@@ -658,11 +886,21 @@ class ColCell(RefCell):
 class VarCell(RefCell):
     ''' (:...)
     '''
+    __slots__ = ('_name',)
+
     def __init__(self, loc, row, args):
         super().__init__(loc, row, args)
 
+        # symbol names are nearly always literal, get them once
+        self._name = _DYNAMIC
+        if args and args[0].constant():
+            self._name = args[0]()
+
     def __call__(self, arg=None, syms=None):
-        return syms[self[0]()]
+        name = self._name
+        if name is _DYNAMIC:
+            name = self[0]()
+        return syms[name]
 
 
 ## HexCell
@@ -677,22 +915,46 @@ def add_props(bits=7, carry=False):
 class HexCell(ListCell):
     ''' implement (# vv ...), hex values, lists of hex values
     '''
+    __slots__ = ('_fixed',)
+
     def __init__(self, loc, row, args):
         super().__init__(loc, row, args)
 
+        # hex values are nearly always constant bytes
+        #  one byte is kept as an int, several as a tuple
+        self._fixed = _DYNAMIC
+        if self.constant():
+            if len(args) == 1:
+                fixed = args[0]()
+                if isinstance(fixed, list):
+                    # nested hex, callers still get a list of their own
+                    self._fixed = tuple(fixed)
+                elif isinstance(fixed, (int, float, str)):
+                    self._fixed = fixed
+            else:
+                fixed = tuple([val() for val in args])
+                if all([isinstance(val, (int, float, str))
+                        for val in fixed]):
+                    self._fixed = fixed
+
     def __call__(self, arg=None, syms=None):
-        if len(self._value) == 1:
-            # if there is only one value, return an int
-            return self[0](arg, syms)
-        else:
+        fixed = self._fixed
+        if fixed is _DYNAMIC:
+            cells = self._value
+            if len(cells) == 1:
+                # if there is only one value, return an int
+                return cells[0](arg, syms)
             # nope, return list of eval'd sub-cells
-            return super().__call__(arg, syms)
+            return [cell(arg, syms) for cell in cells]
+
+        if isinstance(fixed, tuple):
+            # every caller gets a list of its own
+            return list(fixed)
+        return fixed
 
     def __str__(self):
-        result = '(#'
-        for val in super().__call__():
-            result += ' %02X' % val
-        return result + ')'
+        return '(#%s)' % ''.join(
+            [' %02X' % val for val in super().__call__()])
 
     def __add__(self, other):
         ''' add with default policy: 7 bits (MIDI), no carry
@@ -705,6 +967,10 @@ class HexCell(ListCell):
         if props is None:
             props = add_props()
 
+        if isinstance(other, LazyCell):
+            # resolve the other cell's type before checking it
+            other = other._parse()
+
         if isinstance(other, bytearray):
             # convert bytearray to array of ints
             other = [ int(bbb.hex(), 16)
@@ -769,10 +1035,52 @@ class HexCell(ListCell):
 class MatchCell(ListCell):
     ''' implement (= n target)
     '''
-    #
+    __slots__ = (
+        '_bytec', '_fixed', '_dest', '_destfunc',
+        '_op', '_matches', '_run')
+
     def __init__(self, loc, row, args):
+        ''' ctor.  the shape of a match expression is fixed once
+              parsed: classify it here instead of on every call
+        '''
         super().__init__(loc, row, args)
 
+        if len(args) < 2:
+            # incomplete expression, complain only if used
+            self._run = self._run_short
+            return
+
+        bytec, dest, rest = args[0], args[1], args[2:]
+
+        # a literal byte count needs no evaluation
+        # pylint: disable=unidiomatic-typecheck
+        self._bytec = bytec
+        self._fixed = bytec() if type(bytec) is AtomCell else None
+
+        # dest is NULL, asserts a value
+        self._dest = dest
+        self._destfunc = (
+            self._check if isinstance(dest, HexCell) else self._store)
+
+        # rest is ([OpCell] [MatchCell...])
+        self._op = None
+        if rest and isinstance(rest[0], OpCell):
+            self._op = rest.pop(0)
+
+        for cell in rest:
+            if not isinstance(cell, MatchCell):
+                raise ValueError(
+                    '%s: unexpected %s in MatchCell: %s' % (
+                        self._loc, cell.__class__.__name__, cell))
+        self._matches = rest
+
+        if self._matches:
+            self._run = self._run_nested
+        elif self._op:
+            self._run = self._run_op
+        else:
+            self._run = self._run_raw
+
     def __call__(self, data, syms):
         ''' evaluate a cell that picks values out of data
             - data: bytearray to be parsed
@@ -797,65 +1105,91 @@ class MatchCell(ListCell):
         #  dest       := AtomCell -> string
         #                | ListCell -> string
         #  Op-Expr    := OpCell -> bytes
-        def store(dest, val, syms):
-            ''' put a value in the symbol table
-            '''
-            syms[dest] = val
-
-        def check(dest, val, syms):
-            ''' check a current value
-            '''
-            # pylint: disable=unused-argument
-            val = val.split()
-            if len(val) == 1:
-                val = val[0]
-            if val != dest:
-                raise ValueError(
-                    '%s: byte stream mismatch: %s != %s' % (
-                        self._loc, val, dest))
+        if isinstance(data, (bytes, bytearray)):
+            # slices of a memoryview share the caller's buffer,
+            #  nested MatchCells see the same bytes without copies
+            data = memoryview(data)
 
-        val = self[:]       # need control over eval of sub components
+        return self._run(data, syms)
 
-        bytec, dest, rest = val[0], val[1], val[2:]
-        bytec = bytec(data, syms)
-        bytec = bytec if bytec else len(data)
+    def _count(self, data, syms):
+        ''' number of bytes to match, all of them if unspecified
+        '''
+        bytec = self._fixed
+        if bytec is None:
+            bytec = self._bytec(data, syms)
+        return bytec if bytec else len(data)
 
-        # eval dest
-        destfunc = store
-        if isinstance(dest, HexCell):
-            # dest is NULL, asserts a value
-            destfunc = check
+    def _store(self, dest, val, syms):
+        ''' put a value in the symbol table
+        '''
+        # pylint: disable=no-self-use
+        syms[dest] = val
 
-        dest = dest(data, syms)
+    def _check(self, dest, val, syms):
+        ''' check a current value
+        '''
+        # pylint: disable=unused-argument
+        val = val.split()
+        if len(val) == 1:
+            val = val[0]
+        if val != dest:
+            raise ValueError(
+                '%s: byte stream mismatch: %s != %s' % (
+                    self._loc, val, dest))
+
+    def _run_short(self, data, syms):
+        ''' (= ...) without both a byte count and a dest
+        '''
+        # pylint: disable=unused-argument
+        raise ValueError(
+            '%s: MatchCell needs bytec and dest: %s' % (self._loc, self))
 
-        if len(rest):
-            # rest is ([OpCell] [MatchCell...])
-            if isinstance(rest[0], OpCell):
-                # apply operation to bytec bytes before storing/testing
-                opcell = rest[0]
-                if bytec > 1:
-                    raise ValueError(
-                        '%s: cannot apply op %s to multibyte values' % (
-                            self._loc, opcell))
-                destfunc(dest, opcell(int(data[0]), syms))
-                del rest[0]
-
-            # remaining cells are MatchCells, iterate through them
-            for cell in rest:
-                if not isinstance(cell, MatchCell):
-                    raise ValueError(
-                        '%s: unexpected %s in MatchCell: %s' % (
-                            self._loc, cell.__class__.name, cell))
+    def _run_raw(self, data, syms):
+        ''' (= bytec dest): store or check bytec bytes
+        '''
+        bytec = self._count(data, syms)
+        match = data[0:bytec]
+        if isinstance(match, memoryview):
+            # only leaf values get their own buffer
+            match = bytearray(match)
+        self._destfunc(self._dest(data, syms), match, syms)
+        return bytec
 
-                # apply recursively
-                #  data will be a copy, updates to syms will bubble up
-                cell(data[0:bytec], syms)
+    def _run_op(self, data, syms):
+        ''' (= bytec dest Op-Expr): apply operation to bytec bytes
+              before storing/testing
+        '''
+        bytec = self._count(data, syms)
+        if bytec > 1:
+            raise ValueError(
+                '%s: cannot apply op %s to multibyte values' % (
+                    self._loc, self._op))
+        self._destfunc(
+            self._dest(data, syms), self._op(int(data[0]), syms), syms)
+        return bytec
 
+    def _run_nested(self, data, syms):
+        ''' (= bytec dest [Op-Expr] Match-Expr ...)
+        '''
+        if self._op:
+            bytec = self._run_op(data, syms)
         else:
-            destfunc(dest, data[0:bytec], syms)
+            bytec = self._count(data, syms)
+
+        for cell in self._matches:
+            # apply recursively
+            #  data will be a view, updates to syms will bubble up
+            cell(data[0:bytec], syms)
 
         return bytec
 
+    def constant(self):
+        ''' depends on the data being matched
+        '''
+        # pylint: disable=no-self-use
+        return False
+
     def __str__(self):
         return '(= ' + ' '.join(['%s' % var for var in self[:]]) + ')'
 
@@ -31,43 +31,39 @@ SOX = 0xF0
 EOX = 0xF7
 ACT = 0xFE
 
-def consume_to(stream, thing):
-    ''' skip bytes in stream until thing
+# deleted from messages
+_ACT = bytes([ACT])
+
+def messages(data):
+    ''' split a buffer into sysex messages
+        - data: bytes of a dump
+        - yield: midi data bytes of each message, absent F0, F7
+            framing and active sensing
     '''
+    pos = 0
     while True:
-        mbyte = stream.read(1)
-        if len(mbyte) == 0:
-            return mbyte
+        sox = data.find(SOX, pos)
+        if sox < 0:
+            return
 
-        if mbyte == thing:
-            return mbyte
+        eox = data.find(EOX, sox + 1)
+        if eox < 0:
+            # truncated last message
+            return
+
+        yield data[sox + 1:eox].translate(None, _ACT)
+        pos = eox + 1
 
 @contextlib.contextmanager
 def packets(fpath):
-    ''' get next message from stream
-        - return: array of midi data bytes absent F0, F7 framing
+    ''' read a dump and iterate over its messages
+        - fpath: path to dump file
+        - return: iterator of messages, see messages()
     '''
     with open(fpath, 'rb') as stream:
-        while True:
-            mbyte = consume_to(stream, SOX)
-            if len(mbyte) == 0:
-                return
-
-            midi = []
-
-            while True:
-                mbyte = stream.read(1)
-                if len(mbyte) == 0:
-                    return
-
-                if mbyte == ACT:
-                    continue
-
-                if mbyte == EOX:
-                    yield midi
-                    break
+        data = stream.read()
 
-                midi.append(mbyte)
+    yield messages(data)
 
 
 
@@ -26,6 +26,7 @@
 
 import csv
 import os
+import sys
 import collections
 from psysex import sysex
 from psysex import tab
@@ -84,21 +85,22 @@ class Mod(object):
                         '%s: row has fewer than 3 columns' % (
                             self.loc)) from exc
 
-                if col_a.startswith('!END'):
-                    return
-
-                if col_a.startswith('#'):
+                lead = col_a[:1]
+                if lead == '#':
                     continue
 
-                if col_a.startswith('|'):
+                if lead == '!' and col_a.startswith('!END'):
+                    return
+
+                if lead == '|':
                     raise sysex.TableMetadataError(
                         'missing table header at %s' % self.loc)
 
-                if col_a.startswith(']]'):
+                if col_a[:2] == ']]':
                     meta.desc = line[1:]
                     continue
 
-                if col_a.startswith(']'):
+                if lead == ']':
                     if not col_a[1:]:
                         raise sysex.TableMetadataError(
                             '%s: missing table name' % self.loc)
@@ -111,7 +113,7 @@ class Mod(object):
                         raise sysex.TableMetadataError(
                             '%s: missing table overlay' % self.loc)
 
-                    meta.name = col_a[1:]
+                    meta.name = sys.intern(col_a[1:])
                     meta.cls  = col_b
 
                     cloc = self.loc.copy()
@@ -119,7 +121,7 @@ class Mod(object):
                     meta.over = cell.factory(cloc, None, col_c)
                     continue
 
-                if col_a.startswith('*'):
+                if lead == '*':
                     if not meta.cls:
                         raise sysex.TableMetadataError(
                             '%s: "*" but no table header' % self.loc)
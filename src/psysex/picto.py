@@ -26,6 +26,8 @@
 
 # pylint: disable=bad-whitespace
 
+import functools
+
 __all__ = ['Picto', 'PictoBox', 'PictoHArrow', 'HEAD', 'BASE', 'NONE']
 
 HEAD = 'AH'                        # arrow terminus
@@ -64,15 +66,15 @@ class Picto(object):
 
     def __init__(self, blob):
         ''' ctor: convert blob to self
-            - blob: array of strings
+            - blob: array of strings or of lists of chars
         '''
         can = [list(row) for row in blob]
-        self.vlen = len(blob)
-        self.hlen = max([len(lin) for lin in blob])
-        for row in range(len(blob)):
-            short = self.hlen - len(can[row])
+        self.vlen = len(can)
+        self.hlen = max(map(len, can))
+        for row in can:
+            short = self.hlen - len(row)
             if short:
-                can[row] += [Picto.SPC] * short
+                row += [Picto.SPC] * short
         self._can = can
 
     def __getitem__(self, index):
@@ -84,24 +86,22 @@ class Picto(object):
     def grow(self, rows=None, cols=None):
         ''' add (before, after), (before, after) cells to a canvas
         '''
-        # add full-width rows first
+        # add full-width rows first, each a list of its own
         if rows:
             head, tail = rows
-            newrow = [[Picto.SPC] * self.hlen]
-            # before
-            for row in range(head):
-                self._can = newrow + self._can
-            # after
-            for row in range(tail):
-                self._can += newrow
+            self._can = (
+                [[Picto.SPC] * self.hlen for row in range(head)] +
+                self._can +
+                [[Picto.SPC] * self.hlen for row in range(tail)])
             self.vlen += head + tail
 
         if cols:
             head, tail = cols
             hcols = [Picto.SPC] * head
             tcols = [Picto.SPC] * tail
-            for row in range(self.vlen):
-                self[row] = hcols + self[row] + tcols
+            for row in self._can:
+                row[:0] = hcols
+                row.extend(tcols)
             self.hlen += head + tail
 
         return self
@@ -112,33 +112,33 @@ class Picto(object):
             - hoff: horiz offset for upper left corner
             - voff: vert offset for upper left corner
             - trans: transparent: overwrite with only non-space chars
+            - raise: IndexError if pic does not fit
         '''
         #! at some point, have Picto keep a table of drawn objects
         #!  and their locations.  Have __str__ do the compositing.
         #! this will allow 'erase' and 'move'
 
-        # optimize?
-        if not trans and hoff == 0 and pic.hlen == self.hlen:
-            for off, row in enumerate(pic):
-                self[off+voff] = row[:] # slice-copy
-            return self
+        if (hoff < 0 or voff < 0 or
+                hoff + pic.hlen > self.hlen or voff + pic.vlen > self.vlen):
+            raise IndexError(
+                'picture %dx%d at %d,%d does not fit %dx%d canvas' % (
+                    pic.hlen, pic.vlen, hoff, voff, self.hlen, self.vlen))
 
+        # whole rows are spliced in, one slice assignment per row
+        hend = hoff + pic.hlen
         for row in range(pic.vlen):
-            if not trans:
-                self[row][hoff:hoff+pic.hlen] = pic[row][:]
-                continue
-            for col in range(pic.hlen):
-                if trans and pic[row][col] == Picto.SPC:
-                    continue
-                self[row+voff][col+hoff] = pic[row][col]
+            dest = self[row+voff]
+            if trans:
+                dest[hoff:hend] = [
+                    old if new == Picto.SPC else new
+                    for new, old in zip(pic[row], dest[hoff:hend])]
+            else:
+                dest[hoff:hend] = pic[row]
 
         return self
 
     def __str__(self):
-        result = ''
-        for lin in range(self.vlen):
-            result += ''.join(self[lin]) + '\n'
-        return result
+        return ''.join([''.join(row) + '\n' for row in self._can])
 
 
 class PictoBox(Picto):
@@ -147,28 +147,59 @@ class PictoBox(Picto):
     def __init__(self, hlen, vlen):
         ''' make a hlen * vlen box
         '''
-        lin = Picto.HOR * (hlen-2)
-        spc = Picto.SPC * (hlen-2)
+        super().__init__(PictoBox.template(hlen, vlen))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def template(hlen, vlen):
+        ''' rows of an empty hlen * vlen box, shared by all boxes
+              of that size.  Picto() copies them into its canvas
+        '''
+        lin = (Picto.HOR,) * (hlen-2)
+        spc = (Picto.SPC,) * (hlen-2)
 
-        blob = [Picto.ULC + lin + Picto.URC]
-        blob += (vlen-2) * [(Picto.VER + spc + Picto.VER)]
-        blob += [Picto.LLC + lin + Picto.LRC]
+        blob = [(Picto.ULC,) + lin + (Picto.URC,)]
+        blob += [(Picto.VER,) + spc + (Picto.VER,) for row in range(vlen-2)]
+        blob += [(Picto.LLC,) + lin + (Picto.LRC,)]
 
-        super().__init__(blob)
+        return tuple(blob)
 
     def label(self, text):
-        ''' insert text into box
+        ''' insert text into box, centered on the middle row
+            - raise: IndexError if text is wider than the box
         '''
         horc = int(self.hlen / 2)
         verc = int(self.vlen / 2)
         txtc = int(len(text)/2)
         hpos = horc - txtc
-        return self.draw(verc, hpos, Picto([text]))
+        if hpos < 0 or hpos + len(text) > self.hlen:
+            raise IndexError(
+                'label %r does not fit %d wide box' % (text, self.hlen))
+
+        # the text lands on blank interior, write it directly
+        self[verc][hpos:hpos+len(text)] = text
+        return self
 
 
 class PictoHArrow(Picto):
     ''' horizontal arrows
     '''
+    # (orientation, terminus) -> char for bent arrows
+    BASES = { ('dn', HEAD): Picto.ADN,
+              ('dn', BASE): Picto.BUP,
+              ('dn', NONE): Picto.SPC,
+              ('up', HEAD): Picto.AUP,
+              ('up', BASE): Picto.BDN,
+              ('up', NONE): Picto.SPC }
+
+    # (side, terminus) -> char for flat arrows
+    ENDS = { ('ri', HEAD): Picto.ARI,
+             ('ri', BASE): Picto.BLE,
+             ('ri', NONE): Picto.HOR,
+             ('le', HEAD): Picto.ALE,
+             ('le', BASE): Picto.BRI,
+             ('le', NONE): Picto.HOR }
+
     def __init__(self, hlen, vlen, lend=NONE, rend=HEAD):
         ''' ctor
             - hlen: how long
@@ -176,6 +207,14 @@ class PictoHArrow(Picto):
             - lend: left end in {HEAD, BASE or None}
             - lend: right end in {HEAD, BASE or None}
         '''
+        super().__init__(PictoHArrow.template(hlen, vlen, lend, rend))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def template(hlen, vlen, lend, rend):
+        ''' rows of an arrow, shared by all arrows of that shape.
+              Picto() copies them into its canvas
+        '''
         def base(hlen, updn, lend, rend):
             ''' do arrows and bases
                 - hlen: how wide
@@ -184,13 +223,8 @@ class PictoHArrow(Picto):
                 - rend: right end in in {HEAD, BASE, NONE}
                 - return: assembled string
             '''
-            chars = { 'dn': { 'AH': Picto.ADN,
-                              'BA': Picto.BUP,
-                              'NO': Picto.SPC },
-                      'up': { 'AH': Picto.AUP,
-                              'BA': Picto.BDN,
-                              'NO': Picto.SPC } }
-            return mid(hlen, chars[updn][lend], Picto.SPC, chars[updn][rend])
+            bases = PictoHArrow.BASES
+            return mid(hlen, bases[updn, lend], Picto.SPC, bases[updn, rend])
 
         def mid(hlen, lend, mid, rend):
             ''' do a middle row
@@ -202,22 +236,11 @@ class PictoHArrow(Picto):
             '''
             return lend + mid * (hlen-2) + rend
 
-        def end(leri, xend):
-            ''' get end characters for flat arrows
-                - leri: in {'le', 'ri'}
-                - xend: end type in {HEAD, BASE, NONE}
-            '''
-            chars = { 'ri': { 'AH': Picto.ARI,
-                              'BA': Picto.BLE,
-                              'NO': Picto.HOR },
-                      'le': { 'AH': Picto.ALE,
-                              'BA': Picto.BRI,
-                              'NO': Picto.HOR } }
-            return chars[leri][xend]
+        ends = PictoHArrow.ENDS
 
         if vlen == 0:
             # direct arrow, orient and add ends
-            blob = [mid(hlen, end('le', lend), Picto.HOR, end('ri', rend))]
+            blob = [mid(hlen, ends['le', lend], Picto.HOR, ends['ri', rend])]
 
         elif vlen < 0:
             # 1: ┌──────┐
@@ -238,7 +261,7 @@ class PictoHArrow(Picto):
                       for row in range(0, vlen-1)]                # 2
             blob += [ mid(hlen, Picto.LLC, Picto.HOR, Picto.LRC)] # 3
 
-        super().__init__(blob)
+        return tuple(blob)
 
 
 class PictoVArrow(Picto):
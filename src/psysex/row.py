@@ -23,9 +23,25 @@
 
 from psysex import cell
 
+def _engineset(value):
+    ''' normalize an engine field value for membership tests
+        - return: frozenset of engine names, None for any engine
+    '''
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return frozenset(value)
+    return frozenset((value,))
+
+
 class Row(object):
     ''' represents a table row
+
+        cells are kept in a list, positioned by the colid index
+        shared through the table metadata
     '''
+    __slots__ = ('loc', 'tab', '_keyed', '_cells', '_engines')
+
     def __init__(self, loc, tab, data):
         ''' create a row
             - loc:  [mod, line]
@@ -41,34 +57,46 @@ class Row(object):
         self.loc = loc
         self.tab = tab
         self._keyed = nope
+        self._cells = [None] * len(tab.meta.colidx)
 
-        cloc = self.loc.copy()
-        for nth, colid in enumerate(tab.meta.cols):
-            if colid == '_PAD':
-                # allow horizontal padding
-                self[colid] = ' '
-                continue
+        meta = tab.meta
+        if meta.padded:
+            # allow horizontal padding
+            self['_PAD'] = ' '
 
+        cloc = self.loc.copy()
+        for nth, colid in meta.cellcols:
             cloc['col'] = nth+1
-            if colid == self.tab.elipse:
-                # syntactic sugar.
-                #   convert remaining cols to a '(x y z t)' cell
-                subcells = []
-                scloc = cloc.copy()
-                for jth, col in enumerate(data[nth:]):
-                    if not col:
-                        # allow empty cells in elipical strings
-                        continue
-                    scloc['arg'] = jth
-                    subcells.append(cell.factory(scloc, self, col))
-                self[colid] = cell.factory(cloc, self, subcells)
-                break
-
             self[colid] = cell.factory(cloc, self, data[nth])
 
+        if meta.elipcol is not None:
+            # syntactic sugar.
+            #   convert remaining cols to a '(x y z t)' cell
+            nth = meta.elipcol
+            cloc['col'] = nth+1
+            subcells = []
+            scloc = cloc.copy()
+            for jth in range(len(data) - nth):
+                col = data[nth + jth]
+                if not col:
+                    # allow empty cells in elipical strings
+                    continue
+                scloc['arg'] = jth
+                subcells.append(cell.factory(scloc, self, col))
+            self[tab.elipse] = cell.factory(cloc, self, subcells)
+
         if tab.keyid:
             self._keyed = self[tab.keyid]
 
+        # fold a constant engine field once, rows are engine-tested
+        #   on every lookup
+        try:
+            self._engines = self['engine']
+        except AttributeError:
+            self._engines = None
+        if self._engines is not None and self._engines.constant():
+            self._engines = _engineset(self._engines())
+
     @property
     def key(self):
         ''' return the value of the key cell
@@ -85,7 +113,21 @@ class Row(object):
         ''' return a specific cell
             - colid: cell identifier
         '''
-        return getattr(self, colid)
+        try:
+            acell = self._cells[self.tab.meta.colidx[colid]]
+        except (KeyError, IndexError):
+            acell = None
+        if acell is None:
+            raise AttributeError(
+                '%s: no col %s' % (self.loc, colid))
+        return acell
+
+    def __getattr__(self, colid):
+        ''' cells are also reachable as attributes
+        '''
+        if colid.startswith('__') or colid in Row.__slots__:
+            raise AttributeError(colid)
+        return self[colid]
 
     def __setitem__(self, colid, acell):
         ''' replace the cell at colid
@@ -93,33 +135,32 @@ class Row(object):
             - acell: new cell
         '''
         #! don't forget to key check updates to unique cols
-        setattr(self, colid, acell)
+        colidx = self.tab.meta.colidx
+        nth = colidx.setdefault(colid, len(colidx))
+        if nth >= len(self._cells):
+            self._cells.extend([None] * (nth + 1 - len(self._cells)))
+        self._cells[nth] = acell
         return acell
 
     def in_engine(self, rqrow):
         ''' true if rqrow is in the engine field
         '''
-        # pylint: disable=no-member
-        #   not happy with setattr shenanigans
-
-        if self.engine is None:
+        engines = self._engines
+        if isinstance(engines, cell.AtomCell):
+            engines = _engineset(engines())
+        if engines is None:
             return True
 
-        rqe = rqrow.split('.')[0]
-        return rqe in self.engine()
+        return rqrow.split('.', 1)[0] in engines
 
     def __str__(self):
-        result = ''
-        for colid in self.tab.meta.cols:
-            if colid != '_PAD':
-                result += '| %s ' % self[colid]
-        return result
+        return ''.join([
+            '| %s ' % self[colid]
+            for colid in self.tab.meta.showcols])
 
     def aswiki(self):
         ''' render a row as a row of a mediawiki table
         '''
-        result = '|-\n| |\n'
-        for colid in self.tab.meta.cols:
-            if colid != '_PAD':
-                result += '| | %s\n' % self[colid]
-        return result
+        return '|-\n| |\n' + ''.join([
+            '| | %s\n' % self[colid]
+            for colid in self.tab.meta.showcols])
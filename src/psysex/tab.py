@@ -24,6 +24,8 @@
 
 # pylint: disable=bad-whitespace
 
+import sys
+import bisect
 from psysex import algo
 from psysex import row
 from psysex.sysex import SysexLookupError
@@ -37,6 +39,11 @@ class TableMetaData(object):
     '''
     def __init__(self):
         self.cols = None
+        self.colidx = None
+        self.showcols = None
+        self.cellcols = None
+        self.elipcol = None
+        self.padded = False
         self.desc = None
         self._cls  = None
         self.name = None
@@ -107,10 +114,32 @@ class TableMetaData(object):
                 raise ValueError(
                     'Table %s: duplicate col id: %s at %s' % (
                         self.name, colid, tab.loc))
-            colids.append(colid)
+            # colids are dict keys in every lookup
+            colids.append(sys.intern(colid))
 
         self.cols = colids
 
+        # cols that are rendered: all but padding
+        self.showcols = tuple([colid for colid in colids if colid != '_PAD'])
+
+        # one position per distinct colid, shared by all rows
+        self.colidx = {}
+        for colid in colids:
+            self.colidx.setdefault(colid, len(self.colidx))
+
+        # how Row() fills itself: (nth, colid) of plain cell cols,
+        #   then the elipsis col, which swallows the rest of the line
+        cellcols = []
+        for nth, colid in enumerate(colids):
+            if colid == '_PAD':
+                self.padded = True
+            elif colid == tab.elipse:
+                self.elipcol = nth
+                break
+            else:
+                cellcols.append((nth, colid))
+        self.cellcols = tuple(cellcols)
+
     def __str__(self):
         return self.name
 
@@ -129,6 +158,8 @@ class Table(object):
         self.elipse = None
         self.index = {}
         self._rows = []
+        self._byval = {}
+        self._found = {}
         self.meta.bind(self)
         self._load(mod.reader)
 
@@ -142,6 +173,8 @@ class Table(object):
                     self.mod.loc, self.meta.name, arow.key, self.keyid))
         self.index[arow.rkey] = arow
         self._rows.append(arow)
+        self._byval.clear()
+        self._found.clear()
 
     def _load(self, reader):
         ''' read a table from csv.reader
@@ -149,10 +182,11 @@ class Table(object):
         for line in reader:
             self.mod.loc['row'] += 1
 
-            if line[0].startswith('#'):
+            lead = line[0][:1]
+            if lead == '#':
                 continue
 
-            if not line[0].startswith('|'):
+            if lead != '|':
                 return
 
             self._addrow(row.Row(self.mod.loc, self, line[1:]))
@@ -161,7 +195,6 @@ class Table(object):
         ''' return rows where rowid matches the key value
               filter by matches of rqrow in engine field
         '''
-        rows = []
         if colid is None:
             if self.keyid:
                 try:
@@ -171,9 +204,38 @@ class Table(object):
 
             colid = 'ident' if self.ident is None else self.ident
 
+        # the same lookups recur on every byte converted
+        try:
+            found = self._found[rowid, rqrow, colid, first]
+        except KeyError:
+            found = self._findrows(rowid, rqrow, colid, first)
+            if isinstance(found, list):
+                found = tuple(found)
+            self._found[rowid, rqrow, colid, first] = found
+        except TypeError:
+            # unhashable rowid, no caching
+            return self._findrows(rowid, rqrow, colid, first)
+
+        # callers own the list they get, the cached rows stay put
+        return list(found) if isinstance(found, tuple) else found
+
+    def _findrows(self, rowid, rqrow, colid, first):
+        ''' getrows() without the caching
+        '''
+        index = self._valindex(colid)
+        if index is None:
+            matches = (
+                arow for arow in self._rows if arow[colid]() == rowid)
+        else:
+            try:
+                matches = index.get(rowid, ())
+            except TypeError:
+                # unhashable rowid can't equal a hashable col value
+                matches = ()
+
         rows = []
-        for arow in self._rows:
-            if arow[colid]() == rowid and arow.in_engine(rqrow):
+        for arow in matches:
+            if arow.in_engine(rqrow):
                 if first:
                     return arow
                 else:
@@ -193,6 +255,32 @@ class Table(object):
                 (rowid, rqrow, colid))
 
 
+    def _valindex(self, colid):
+        ''' rows grouped by their value in colid, in table order
+              built on first use
+            - return: dict, or None if colid holds computed or
+                unhashable values and has to be scanned
+        '''
+        try:
+            return self._byval[colid]
+        except KeyError:
+            pass
+
+        index = {}
+        for arow in self._rows:
+            acell = arow[colid]
+            if not acell.constant():
+                index = None
+                break
+            try:
+                index.setdefault(acell(), []).append(arow)
+            except TypeError:
+                index = None
+                break
+
+        self._byval[colid] = index
+        return index
+
     def get1row(self, rowid, rqrow, colid=None):
         ''' get a unique row, qualified by rowid and membership of
              the rqrow in the engine field of the requested row
@@ -221,12 +309,9 @@ class Table(object):
         result += "* ident: %s\n" % self.ident
         result += '|- \n'
         result += '! |\n'
-        for colid in self.meta.cols:
-            if colid == '_PAD':
-                continue
+        for colid in self.meta.showcols:
             result += '! style="text-align:left"| %s\n' % colid
-        for arow in self._rows:
-            result += arow.aswiki()
+        result += ''.join([arow.aswiki() for arow in self._rows])
         result += '|}\n\n'
         return result
 
@@ -243,8 +328,7 @@ class Table(object):
         result += '    KeyId: (*)%s\n' % self.keyid
         result += '    Ident: (@)%s\n' % self.ident
         result += '    Rows:\n'
-        for arow in self._rows:
-            result += '      %s\n' % arow
+        result += ''.join(['      %s\n' % arow for arow in self._rows])
 
         return result
 
@@ -451,6 +535,43 @@ class ValueTable(Table):
     '''
     def __init__(self, mod, meta):
         super().__init__(mod, meta)
+        self._keys = {}
+
+    def _above(self, colid, key):
+        ''' position of the first row whose colid value exceeds key
+              column values are gathered once, rows are normally in
+              ascending order and can be bisected
+            - return: row number, len(rows) if there is none
+        '''
+        try:
+            keys, ascending = self._keys[colid]
+        except KeyError:
+            keys = [arow[colid]() for arow in self._rows]
+            ascending = all(
+                [left <= right for left, right in zip(keys, keys[1:])])
+            self._keys[colid] = keys, ascending
+
+        if ascending:
+            return bisect.bisect_right(keys, key)
+
+        for nth, val in enumerate(keys):
+            if val > key:
+                return nth
+        return len(keys)
+
+    def _span(self, colid, key):
+        ''' find the rows between which key falls
+            - return: (data, value) of the row at or below key, 0s if
+                none, and the row above it, or the last row
+        '''
+        nth = self._above(colid, key)
+        if nth:
+            below = self._rows[nth - 1]
+            low = below.data(), below.value()
+        else:
+            low = 0, 0
+
+        return low, self._rows[min(nth, len(self._rows) - 1)]
 
     def value(self, data):
         ''' sparse lookup with interpolation
@@ -458,18 +579,10 @@ class ValueTable(Table):
         '''
         # pylint: disable=no-member
         #   pylint doesn't know cells
-
-        # find the rows between which the midi byte falls
-        ilast = flast = arow = 0
-        for arow in self._rows:
-            idata = arow.idata()
-            if idata > data:
-                break
-            ilast = idata
-            flast = arow.fdata()
+        (ilast, flast), arow = self._span('data', data)
 
         # interpolate
-        return round(arow.scale() * (data - ilast) + flast, arow.prec())
+        return round(arow.factor() * (data - ilast) + flast, arow.round())
 
     def midi(self, value):
         ''' sparse lookup with interpolation
@@ -477,19 +590,11 @@ class ValueTable(Table):
         '''
         # pylint: disable=no-member
         #   pylint doesn't know cells
-
-        # find the rows between which the provided value falls
-        dlast = flast = arow = 0
-        for arow in self._rows:
-            fdata = arow.fdata()
-            if fdata > value:
-                break
-            flast = fdata
-            dlast = arow.idata()
+        (dlast, flast), arow = self._span('value', value)
 
         # interpolate
         return int(
-            round(arow.scale() * (value - flast) + dlast, 0))
+            round(arow.factor() * (value - flast) + dlast, 0))
 
 
 @registered
@@ -498,16 +603,65 @@ class VendorTable(Table):
     '''
     def __init__(self, mod, meta):
         super().__init__(mod, meta)
+        # MMA ids are one byte, or three bytes led by 0x00
+        #   vendors may share an id, keep every row for it
+        self._byid = {}
         for arow in self._rows:
-            if arow.mma_id[0] == 0x00:
-                arow['_idlen'] = 1
+            mma_id = arow.mma_id()
+            if isinstance(mma_id, list):
+                mma_id = tuple(mma_id)
             else:
-                arow['_idlen'] = 3
+                mma_id = (mma_id,)
+            arow['_idlen'] = len(mma_id)
+            self._byid.setdefault(mma_id, []).append(arow)
 
     def mma_lookup(self, data):
         ''' return the row matching the first 1 or 3 bytes in
               the data stream
+            - raise: SysexLookupError if no vendor, or more than one,
+                has that id
         '''
-        idlen = 1 if data[0] == 0x00 else 3
-        arow = self.get1row(data[0:idlen], rqrow=None, colid='mma_id')
-        return arow
+        idlen = 3 if data[0] == 0x00 else 1
+        rows = self._byid.get(tuple(data[0:idlen]))
+        if not rows:
+            raise SysexLookupError(
+                'row', self.meta.name,
+                'no values found',
+                (data[0:idlen], None, 'mma_id'))
+        if len(rows) > 1:
+            raise SysexLookupError(
+                'row', self.meta.name,
+                'rows not unique',
+                (data[0:idlen], None, 'mma_id'))
+
+        return rows[0]
+
+
+def units():
+    ''' run unit tests
+          PSYSEX_MODS must point at the data directory
+    '''
+    # pylint: disable=import-outside-toplevel
+    #   mod imports tab
+    from psysex import mod
+
+    dxmod = mod.Mod('yamaha.reface.DX')
+    params = dxmod['Params']
+    name = params._rows[0]['name']()
+
+    # changing a getrows result must not reach the cached rows
+    rows = params.getrows(name, None, 'name')
+    print('getrows %s: %d rows' % (name, len(rows)))
+    rows.clear()
+    rows = params.getrows(name, None, 'name')
+    print('getrows %s after clear: %d rows' % (name, len(rows)))
+    assert rows, 'cached getrows result was altered by a caller'
+
+    try:
+        params.getrows('no such name', None, 'name')
+    except SysexLookupError as exc:
+        print(exc)
+
+
+if __name__ == '__main__':
+    units()